@@ -11,6 +11,7 @@
 
 import mido
 from mido import Message, MidiFile, MidiTrack
+from functools import lru_cache
 import random
 import sys
 import tkinter as tk
@@ -82,6 +83,12 @@ PATTERNS = [
     [0.375, 0.375, 0.25]  # dotted quarter, dotted quarter, quarter
 ]
 
+# Candidate melody notes for each (key, chord) pair, filled in lazily by get_candidate_notes
+_CANDIDATE_CACHE = {}
+
+# note_to_midi is a pure function over a small set of note names and is called
+# for every candidate note while building a melody, so its results are cached
+@lru_cache(maxsize=None)
 def note_to_midi(note):
     """
     Convert a note name to a MIDI note number.
@@ -117,6 +124,32 @@ def get_chord_notes(chord):
     """
     return CHORDS[chord]
 
+def get_candidate_notes(key, chord):
+    """
+    Get the notes of a key that belong to a chord, across the melody's octave range.
+
+    The candidates depend only on the key and the chord, so they are computed
+    once per pair and cached in _CANDIDATE_CACHE.
+
+    Args:
+        key (str): The musical key.
+        chord (str): The chord name (e.g., 'C', 'F#m').
+
+    Returns:
+        list: (note name, MIDI note number) tuples, ordered by scale degree then octave.
+    """
+    candidates = _CANDIDATE_CACHE.get((key, chord))
+    if candidates is None:
+        chord_notes = get_chord_notes(chord)
+        # We consider three octaves to give the melody some range
+        candidates = [
+            (note + str(octave), note_to_midi(note + str(octave)))
+            for note in SCALE[key] if note in chord_notes
+            for octave in range(4, 7)
+        ]
+        _CANDIDATE_CACHE[(key, chord)] = candidates
+    return candidates
+
 def generate_motif(length, key):
     """
     Generate a motif of a given length in a given key.
@@ -150,52 +183,44 @@ def generate_melody(key, num_notes, chord_progression, motif_length=4):
     Returns:
         list: The generated melody as a list of note names.
     """
-# Fetch the scale for the key the melody is in
-notes_in_key = SCALE[key]
+    # Generate a musical motif (a short, recurring musical idea) within the key
+    motif = generate_motif(motif_length, key)
 
-# Generate a musical motif (a short, recurring musical idea) within the key
-motif = generate_motif(motif_length, key)
+    # The motif is the starting point of our melody
+    melody = motif.copy()
 
-# The motif is the starting point of our melody
-melody = motif.copy()
+    # Continue generating the rest of the melody beyond the initial motif
+    for i in range(motif_length, num_notes):
+        # We choose the chord based on our chord progression. The chord is used to give a sense of harmony.
+        # We cycle through the chord progression by using the modulo (%) operator.
+        chord = chord_progression[i % len(chord_progression)]
 
-# Continue generating the rest of the melody beyond the initial motif
-for i in range(motif_length, num_notes):
-    # We choose the chord based on our chord progression. The chord is used to give a sense of harmony.
-    # We cycle through the chord progression by using the modulo (%) operator.
-    chord = chord_progression[i % len(chord_progression)]
+        # Fetch the notes of our scale that are in this chord, in each octave we use
+        candidates = get_candidate_notes(key, chord)
 
-    # Fetch the notes that make up this chord
-    chord_notes = get_chord_notes(chord)
+        # The previous note is used to ensure the melody has smooth transitions
+        prev_midi = note_to_midi(melody[-1])
 
-    # The previous note is used to ensure the melody has smooth transitions
-    prev_note = melody[-1]
-
-    # Initialize the next note to be chosen and the minimum interval
-    next_note = None
-    min_interval = len(NOTES)
-
-    # We iterate through each note in our scale
-    for note in notes_in_key:
-        # We consider three octaves to give the melody some range
-        for octave in range(4, 7):
-            # Create a note in the current octave
-            note_with_octave = note + str(octave)
+        # Initialize the next note to be chosen and the minimum interval
+        next_note = None
+        min_interval = len(NOTES)
 
+        # We iterate through each candidate note
+        for note_with_octave, midi in candidates:
             # Calculate the interval between this note and the previous note
-            interval = get_interval(prev_note, note_with_octave)
+            interval = abs(midi - prev_midi)
 
-            # If this interval is smaller than our current smallest interval and the note is in the current chord,
+            # If this interval is smaller than our current smallest interval,
             # we choose this note as our next note
-            if interval < min_interval and note in chord_notes:
+            if interval < min_interval:
                 next_note = note_with_octave
                 min_interval = interval
 
-    # Add the chosen note to the melody
-    melody.append(next_note)
+        # Add the chosen note to the melody
+        melody.append(next_note)
 
-# Return the complete melody
-return melody
+    # Return the complete melody
+    return melody
 
 
 def create_midi_file(melody, bpm, time_signature, output_file):